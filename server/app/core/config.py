@@ -132,6 +132,12 @@ class Settings(BaseSettings):
         default=30,
         description="액세스 토큰 만료 시간 (분)"
     )
+    BCRYPT_COST: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt work factor (운영 서버에서 해시 1회가 약 250ms가 되도록 조정)"
+    )
 
     # ====================
     # Logging Settings
@@ -182,6 +188,20 @@ class Settings(BaseSettings):
         default=10,
         description="Oracle 커넥션 풀 최대 오버플로우"
     )
+    ORACLE_DB_POOL_PRE_PING: bool = Field(
+        default=False,
+        description="Oracle 커넥션 체크아웃 시 ping 여부 (True면 요청마다 왕복 1회 추가)"
+    )
+    ORACLE_STMT_CACHE_SIZE: int = Field(
+        default=50,
+        ge=0,
+        description="oracledb 연결별 statement cache 크기 (동일 SQL의 soft parse 생략)"
+    )
+    ORACLE_DB_QUERY_CACHE_SIZE: int = Field(
+        default=1200,
+        ge=0,
+        description="SQLAlchemy 컴파일 SQL 캐시 크기 (0이면 캐시 안 함)"
+    )
 
     @field_validator("ORACLE_DATABASE_URL", mode="before")
     @classmethod
@@ -210,6 +230,35 @@ class Settings(BaseSettings):
     # 여기에 도메인별 설정을 추가할 수 있습니다
     # 예: ENABLE_SAMPLE_DOMAIN: bool = True
 
+    # Auth 도메인: 사용자 조회 캐시
+    AUTH_USER_CACHE_TTL_SECONDS: float = Field(
+        default=60.0,
+        ge=0,
+        description="사용자 조회 결과 캐시 유지 시간 (초, 0이면 캐시 안 함)"
+    )
+    AUTH_USER_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        ge=1,
+        description="사용자 조회 캐시 최대 항목 수"
+    )
+
+    # Auth 도메인: 로그인 요청 제한 (워커 프로세스 단위)
+    AUTH_LOGIN_RATE_LIMIT_PER_IP: int = Field(
+        default=5,
+        ge=1,
+        description="클라이언트 IP당 기간 내 허용 로그인 요청 수"
+    )
+    AUTH_LOGIN_RATE_LIMIT_PER_USERNAME: int = Field(
+        default=20,
+        ge=1,
+        description="사용자 ID당 기간 내 허용 로그인 시도 수 (분산 공격 대비)"
+    )
+    AUTH_LOGIN_RATE_LIMIT_PERIOD_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="로그인 요청 제한 기간 (초)"
+    )
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -7,6 +7,7 @@ from typing import AsyncGenerator
 
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -36,7 +37,14 @@ oracle_engine = create_async_engine(
     echo=settings.ORACLE_DB_ECHO,
     pool_size=settings.ORACLE_DB_POOL_SIZE,
     max_overflow=settings.ORACLE_DB_MAX_OVERFLOW,
-    pool_pre_ping=True,  # 연결 유효성 자동 검사
+    # 로그인처럼 짧은 조회에서는 ping 왕복 비용이 커서 기본 비활성화
+    pool_pre_ping=settings.ORACLE_DB_POOL_PRE_PING,
+    # 컴파일된 SQL 캐시: 레거시 조회문이 밀려나지 않도록 기본값(500)보다 크게 설정
+    query_cache_size=settings.ORACLE_DB_QUERY_CACHE_SIZE,
+    connect_args={
+        # 연결별 statement cache: SQL 문자열이 동일하면 서버 측 parse를 재사용
+        "stmtcachesize": settings.ORACLE_STMT_CACHE_SIZE,
+    },
 )
 
 # ====================
@@ -144,6 +152,27 @@ async def get_oracle_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_oracle_engine() -> AsyncEngine:
+    """
+    FastAPI dependency: Oracle 데이터베이스 엔진 제공 (Legacy TMS)
+
+    ORM 엔티티나 Unit of Work가 필요 없는 단순 조회(Raw SQL)용입니다.
+    요청 시작 시 연결을 미리 점유하지 않고, 실제로 쿼리가 필요한 시점에만
+    engine.connect()로 풀에서 연결을 꺼내 쿼리 직후 반환합니다.
+    (캐시 적중이나 bcrypt 검증 중에는 연결을 점유하지 않음)
+
+    사용법:
+        @router.post("/auth/login")
+        async def login(oracle_engine: AsyncEngine = Depends(get_oracle_engine)):
+            async with oracle_engine.connect() as conn:
+                ...
+
+    Returns:
+        AsyncEngine: Oracle 데이터베이스 엔진
+    """
+    return oracle_engine
+
+
 # ====================
 # Database Utilities
 # ====================
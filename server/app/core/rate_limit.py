@@ -0,0 +1,146 @@
+"""
+Core Rate Limiting
+
+Token Bucket 기반의 프로세스 내 요청 제한(rate limit) 유틸리티입니다.
+- 키(IP, 사용자 ID 등)별 토큰 버킷
+- 클라이언트 IP 기반 FastAPI 의존성
+
+Note:
+    제한 상태는 워커 프로세스마다 따로 유지됩니다.
+    여러 워커/서버 전체에 공통 한도가 필요하면 Redis 등 외부 저장소 기반으로 교체하세요.
+"""
+
+import math
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request, status
+
+RATE_LIMIT_MESSAGE = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요"
+
+
+# ====================
+# Token Bucket
+# ====================
+
+
+class TokenBucketRateLimiter:
+    """
+    키별 Token Bucket 요청 제한기
+
+    각 키는 최대 capacity개의 토큰을 가지며, period초마다 capacity개의 속도로
+    토큰이 다시 채워집니다. 요청 1건당 토큰 1개를 소비합니다.
+
+    사용 예시:
+        limiter = TokenBucketRateLimiter(capacity=5, period=60)
+        retry_after = limiter.acquire(client_ip)
+        if retry_after > 0:
+            raise HTTPException(status_code=429)
+    """
+
+    def __init__(self, capacity: int, period: float, max_keys: int = 100_000):
+        """
+        Args:
+            capacity: 버킷 크기 (period 동안 허용되는 요청 수)
+            period: 버킷이 가득 차기까지 걸리는 시간 (초)
+            max_keys: 추적할 최대 키 수 (초과 시 가장 오래 사용되지 않은 키부터 제거)
+        """
+        self.capacity = capacity
+        self.period = period
+        self.max_keys = max_keys
+        self._refill_rate = capacity / period  # 초당 충전되는 토큰 수
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, key: str) -> float:
+        """
+        키의 토큰 1개를 소비합니다.
+
+        Args:
+            key: 제한 단위 키 (IP, 사용자 ID 등)
+
+        Returns:
+            float: 0이면 허용, 0보다 크면 다음 토큰까지 남은 시간 (초)
+        """
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (float(self.capacity), now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self._refill_rate)
+
+        if tokens >= 1:
+            retry_after = 0.0
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self._refill_rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        return retry_after
+
+    def clear(self) -> None:
+        """모든 키의 제한 상태를 초기화합니다."""
+        self._buckets.clear()
+
+
+def retry_after_headers(retry_after: float) -> dict[str, str]:
+    """
+    429 응답에 포함할 Retry-After 헤더를 생성합니다.
+
+    Args:
+        retry_after: 다음 토큰까지 남은 시간 (초)
+
+    Returns:
+        dict[str, str]: Retry-After 헤더 (정수 초, 올림)
+    """
+    return {"Retry-After": str(math.ceil(retry_after))}
+
+
+# ====================
+# Rate Limit Dependencies
+# ====================
+
+
+class ClientIPRateLimit:
+    """
+    클라이언트 IP 기반 요청 제한 의존성
+
+    라우트의 dependencies에 등록하면 본문 파싱, DB 연결 등
+    다른 처리보다 먼저 실행되어 초과 요청을 즉시 거부합니다.
+
+    사용법:
+        login_rate_limit = ClientIPRateLimit(TokenBucketRateLimiter(capacity=5, period=60))
+
+        @router.post("/login", dependencies=[Depends(login_rate_limit)])
+        async def login(...):
+            ...
+
+    Note:
+        프록시 뒤에서는 uvicorn --proxy-headers 설정으로 request.client가
+        실제 클라이언트 IP가 되도록 해야 합니다. (X-Forwarded-For를 직접 신뢰하면 우회 가능)
+    """
+
+    def __init__(self, limiter: TokenBucketRateLimiter):
+        """
+        Args:
+            limiter: IP별 토큰 버킷
+        """
+        self.limiter = limiter
+
+    async def __call__(self, request: Request) -> None:
+        """
+        요청 IP의 한도를 확인합니다.
+
+        Raises:
+            HTTPException: 한도 초과 시 (429, Retry-After 헤더 포함)
+        """
+        client_ip = request.client.host if request.client else "unknown"
+        retry_after = self.limiter.acquire(client_ip)
+
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=RATE_LIMIT_MESSAGE,
+                headers=retry_after_headers(retry_after),
+            )
@@ -5,16 +5,87 @@ Auth Domain
 Oracle DB를 사용한 비동기 로그인을 처리합니다.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from server.app.core.database import get_oracle_db
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from server.app.core.config import settings
+from server.app.core.database import get_oracle_engine
 from server.app.core.logging import get_logger
+from server.app.core.rate_limit import (
+    RATE_LIMIT_MESSAGE,
+    ClientIPRateLimit,
+    TokenBucketRateLimiter,
+    retry_after_headers,
+)
 from server.app.domain.auth.schemas import LoginRequest, LoginResponse
-from server.app.domain.auth.service import AuthService
+from server.app.domain.auth.service import (
+    INVALID_CREDENTIALS_MESSAGE,
+    LOGIN_ERROR_MESSAGE,
+    AuthService,
+)
+from server.app.shared.exceptions import (
+    NotFoundException,
+    TooManyRequestsException,
+    UnauthorizedException,
+    ValidationException,
+)
 
 logger = get_logger(__name__)
 
+# 서비스 실패 원인(예외 클래스) → HTTP 상태 코드
+# 사용자 없음/비밀번호 불일치는 구분 없이 401로 응답합니다.
+_ERROR_STATUS_CODES: dict[type[Exception], int] = {
+    ValidationException: status.HTTP_400_BAD_REQUEST,
+    NotFoundException: status.HTTP_401_UNAUTHORIZED,
+    UnauthorizedException: status.HTTP_401_UNAUTHORIZED,
+    TooManyRequestsException: status.HTTP_429_TOO_MANY_REQUESTS,
+}
+
+# 고정 메시지 에러 응답 본문은 모듈 로드 시 한 번만 직렬화합니다.
+_STATIC_ERROR_BODIES: dict[str, bytes] = {
+    message: orjson.dumps({"detail": message})
+    for message in (INVALID_CREDENTIALS_MESSAGE, LOGIN_ERROR_MESSAGE, RATE_LIMIT_MESSAGE)
+}
+
+# 요청별 상태가 없는 서비스이므로 한 번만 생성하여 재사용 (DB 엔진은 execute(db=...)로 전달)
+_AUTH_SERVICE = AuthService()
+
+# 클라이언트 IP별 로그인 요청 제한
+# 본문 파싱, DB 조회, bcrypt 검증보다 먼저 실행되어 초과 요청의 비용을 최소화합니다.
+login_ip_rate_limiter = TokenBucketRateLimiter(
+    capacity=settings.AUTH_LOGIN_RATE_LIMIT_PER_IP,
+    period=settings.AUTH_LOGIN_RATE_LIMIT_PERIOD_SECONDS,
+)
+
+
+async def _parse_login_request(request: Request) -> LoginRequest:
+    """
+    요청 본문(JSON)을 LoginRequest로 파싱합니다.
+
+    FastAPI의 기본 처리(JSON → dict → 모델) 대신 Pydantic v2의
+    model_validate_json으로 파싱과 검증을 한 번에 수행합니다.
+    (login 라우트의 dependency로 사용)
+
+    Raises:
+        RequestValidationError: JSON 형식 또는 필드 검증 실패 (422)
+    """
+    body = await request.body()
+    try:
+        return LoginRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ],
+            body=body,
+        ) from e
+
+
 # ====================
 # Router
 # ====================
@@ -27,8 +98,19 @@ router = APIRouter(
 
 @router.post(
     "/login",
-    response_model=LoginResponse,
+    dependencies=[Depends(ClientIPRateLimit(login_ip_rate_limiter))],
+    # 응답은 직접 직렬화하므로 response_model 검증을 생략 (문서는 responses[200]에 명시)
+    response_model=None,
     status_code=status.HTTP_200_OK,
+    # 본문은 _parse_login_request에서 직접 파싱하므로 문서용 스키마를 명시
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": LoginRequest.model_json_schema()}
+            },
+        }
+    },
     summary="레거시 TMS 로그인",
     description="""
     레거시 TMS Oracle DB를 사용하여 사용자 로그인을 처리합니다.
@@ -36,18 +118,18 @@ router = APIRouter(
     - **username**: 사용자 ID
     - **password**: 비밀번호
 
-    성공 시 사용자 정보와 임시 토큰을 반환합니다.
-    (추후 JWT 토큰으로 대체 예정)
+    성공 시 사용자 정보와 JWT 액세스 토큰을 반환합니다.
     """,
     responses={
         200: {
+            "model": LoginResponse,
             "description": "로그인 성공",
             "content": {
                 "application/json": {
                     "example": {
                         "user_id": "user001",
                         "user_name": "홍길동",
-                        "token": "temp_token_abc123",
+                        "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                         "message": "로그인 성공"
                     }
                 }
@@ -73,6 +155,16 @@ router = APIRouter(
                 }
             }
         },
+        429: {
+            "description": "요청 횟수 제한 초과 (IP 또는 사용자 ID 기준)",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": RATE_LIMIT_MESSAGE
+                    }
+                }
+            }
+        },
         500: {
             "description": "서버 오류",
             "content": {
@@ -86,44 +178,44 @@ router = APIRouter(
     }
 )
 async def login(
-    request: LoginRequest,
-    oracle_db: AsyncSession = Depends(get_oracle_db)
-) -> LoginResponse:
+    login_request: LoginRequest = Depends(_parse_login_request),
+    oracle_engine: AsyncEngine = Depends(get_oracle_engine)
+) -> Response:
     """
     레거시 TMS 로그인
 
     Oracle DB를 사용하여 사용자 인증을 처리합니다.
     """
-    # 서비스 인스턴스 생성
-    service = AuthService(oracle_db)
-
     # 서비스 실행
-    result = await service.execute(request)
+    result = await _AUTH_SERVICE.execute(login_request, db=oracle_engine)
 
     # 결과 처리
-    if not result.success:
-        # 에러 타입에 따라 적절한 HTTP 상태 코드 반환
-        error_message = result.error or "로그인 처리 중 오류가 발생했습니다"
-
-        # ValidationException 또는 NotFoundException이면 401 반환
-        if "찾을 수 없습니다" in error_message or "일치하지 않습니다" in error_message or "올바르지 않습니다" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=error_message
-            )
-        elif "빈 문자열" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error_message
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=error_message
+    if not result.success or result.data is None:
+        # 에러 타입에 따라 적절한 HTTP 상태 코드 반환 (알 수 없는 실패는 500)
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        if result.error_type is not None:
+            status_code = _ERROR_STATUS_CODES.get(result.error_type, status_code)
+        error_message = result.error or LOGIN_ERROR_MESSAGE
+
+        # 사용자 ID별 제한 초과도 IP 제한과 동일하게 Retry-After 헤더 포함
+        headers = None
+        if result.error_type is TooManyRequestsException and result.metadata:
+            headers = retry_after_headers(result.metadata.get("retry_after", 0))
+
+        # 고정 메시지는 미리 직렬화된 본문을 그대로 사용
+        body = _STATIC_ERROR_BODIES.get(error_message)
+        if body is not None:
+            return Response(
+                content=body,
+                status_code=status_code,
+                headers=headers,
+                media_type="application/json"
             )
 
-    # 성공 시 데이터 반환
-    return result.data
+        raise HTTPException(status_code=status_code, detail=error_message, headers=headers)
+
+    # 성공 시 데이터 반환 (서비스에서 생성한 응답이므로 재검증 없이 직렬화)
+    return ORJSONResponse(result.data.model_dump())
 
 
 __all__ = [
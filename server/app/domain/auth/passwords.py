@@ -0,0 +1,152 @@
+"""
+Auth Domain Password Hashing
+
+비밀번호 해시 형식과 bcrypt 해싱 유틸리티입니다.
+- 해시 형식: $bcrypt-sha256$ + bcrypt(sha256_hex(pw))
+- 레거시 bcrypt 해시($2a$/$2b$/$2y$, 원문 비밀번호 기반) 식별
+- 평문 비밀번호 일괄 마이그레이션용 배치 해싱
+"""
+
+import base64
+import hashlib
+import os
+from typing import Optional
+
+import bcrypt
+
+# 이 서비스가 생성하는 해시의 식별자: $bcrypt-sha256$ + bcrypt(sha256_hex(pw))
+# 원문 비밀번호로 만든 레거시 bcrypt 해시와 구분하기 위해 붙입니다.
+HASH_PREFIX = "$bcrypt-sha256$"
+
+# 레거시 bcrypt 해시 식별자 ($2a$, $2b$, $2y$, 원문 비밀번호를 그대로 해싱한 값)
+LEGACY_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# bcrypt가 사용하는 최대 입력 길이
+# (bcrypt 4.x 이하는 초과분을 무시, 5.x부터는 ValueError 발생)
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# 표준 base64 → bcrypt base64 알파벳 변환 테이블
+_BCRYPT_B64_TABLE = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+    b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+)
+_BCRYPT_SALT_BYTES = 16
+
+
+# ====================
+# Hash Format
+# ====================
+
+
+def prehash_password(password: str) -> bytes:
+    """
+    bcrypt 입력용으로 비밀번호를 SHA-256 hex 문자열로 변환합니다.
+
+    bcrypt는 72바이트 이후 입력을 무시(또는 거부)하므로,
+    bcrypt(hex(sha256(pw)), salt) 형태로 길이를 64바이트로 고정합니다.
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        bytes: SHA-256 hex digest (ASCII 64바이트)
+    """
+    return hashlib.sha256(password.encode("utf-8")).hexdigest().encode("ascii")
+
+
+def _hash_with_salt(password: str, salt: bytes) -> str:
+    """
+    주어진 bcrypt salt로 비밀번호를 해싱합니다. (cost는 salt에 포함된 값 사용)
+
+    Args:
+        password: 평문 비밀번호
+        salt: bcrypt salt ($2b$<cost>$<22자>)
+
+    Returns:
+        str: 식별자를 붙인 bcrypt 해시 ($bcrypt-sha256$$2b$<cost>$...)
+    """
+    return HASH_PREFIX + bcrypt.hashpw(prehash_password(password), salt).decode("utf-8")
+
+
+def hash_password(password: str, cost: int) -> str:
+    """
+    비밀번호를 bcrypt로 해싱합니다.
+
+    Args:
+        password: 평문 비밀번호
+        cost: bcrypt work factor
+
+    Returns:
+        str: 식별자를 붙인 bcrypt 해시 ($bcrypt-sha256$$2b$<cost>$...)
+    """
+    return _hash_with_salt(password, bcrypt.gensalt(cost))
+
+
+def get_bcrypt_cost(password_hash: str) -> Optional[int]:
+    """
+    이 서비스가 생성한 해시($bcrypt-sha256$...)에서 bcrypt work factor를 추출합니다.
+
+    Args:
+        password_hash: 저장된 비밀번호 값
+
+    Returns:
+        Optional[int]: bcrypt cost (레거시 평문/bcrypt 값이면 None)
+    """
+    if not password_hash.startswith(HASH_PREFIX):
+        return None
+    try:
+        return int(password_hash[len(HASH_PREFIX) + 4:len(HASH_PREFIX) + 6])
+    except ValueError:
+        return None
+
+
+# ====================
+# Batch Hashing (Migration)
+# ====================
+
+
+def generate_bcrypt_salts(count: int, cost: int) -> list[bytes]:
+    """
+    bcrypt salt를 한 번에 여러 개 생성합니다.
+
+    bcrypt.gensalt()는 호출마다 os.urandom(16)을 읽으므로,
+    대량 재해싱(마이그레이션 배치 등)에서는 난수를 한 번에 읽어 나눠 사용합니다.
+    형식은 bcrypt.gensalt(cost)와 동일합니다. ($2b$<cost>$<22자>)
+
+    Args:
+        count: 생성할 salt 개수
+        cost: bcrypt work factor
+
+    Returns:
+        list[bytes]: bcrypt.hashpw에 전달할 수 있는 salt 목록
+    """
+    prefix = b"$2b$%02d$" % cost
+    entropy = os.urandom(_BCRYPT_SALT_BYTES * count)
+
+    return [
+        prefix + base64.b64encode(
+            entropy[i:i + _BCRYPT_SALT_BYTES]
+        ).translate(_BCRYPT_B64_TABLE)[:22]
+        for i in range(0, len(entropy), _BCRYPT_SALT_BYTES)
+    ]
+
+
+def hash_passwords(passwords: list[str], cost: int) -> list[str]:
+    """
+    여러 비밀번호를 bcrypt로 해싱합니다. (평문 비밀번호 일괄 마이그레이션용)
+
+    salt는 generate_bcrypt_salts로 한 번에 생성합니다.
+    CPU를 오래 점유하므로 이벤트 루프가 아닌 배치 작업이나 스레드에서 호출하세요.
+
+    Args:
+        passwords: 평문 비밀번호 목록
+        cost: bcrypt work factor
+
+    Returns:
+        list[str]: 입력 순서와 같은 해시 목록 ($bcrypt-sha256$...)
+    """
+    salts = generate_bcrypt_salts(len(passwords), cost)
+    return [
+        _hash_with_salt(password, salt)
+        for password, salt in zip(passwords, salts, strict=True)
+    ]
@@ -5,17 +5,136 @@ Auth Domain Repository
 Raw SQL (text)을 사용하여 직접 쿼리를 실행합니다.
 """
 
-from typing import Optional
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Optional
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
+from server.app.core.config import settings
 from server.app.core.logging import get_logger
 from server.app.domain.auth.schemas import UserRecord
 from server.app.shared.exceptions import NotFoundException
 
 logger = get_logger(__name__)
 
+# TODO: 실제 테이블명과 컬럼명으로 수정 필요
+# 현재는 placeholder 쿼리입니다.
+# 예상 테이블: T_USER, T_MEMBER, USERS 등
+# 예상 컬럼: USER_ID, USER_NAME, PASSWORD, PWD, PASSWD 등
+_FIND_USER_SQL = """
+    SELECT
+        USER_ID,
+        PASSWORD,
+        USER_NAME
+    FROM T_USER
+    WHERE USER_ID = :username
+"""
+
+_UPDATE_PASSWORD_SQL = """
+    UPDATE T_USER
+    SET PASSWORD = :password_hash
+    WHERE USER_ID = :username
+"""
+
+# text() 객체는 모듈 로드 시 한 번만 생성하여 요청마다 재생성하지 않습니다.
+# 동일한 객체를 재사용하므로 SQLAlchemy 컴파일 캐시 키도 매번 동일합니다.
+_FIND_USER_QUERY = text(_FIND_USER_SQL)
+_UPDATE_PASSWORD_QUERY = text(_UPDATE_PASSWORD_SQL)
+
+
+class UserRecordCache:
+    """
+    사용자 조회 결과 캐시 (프로세스 내 LRU + TTL)
+
+    사용자 정보는 거의 변경되지 않으므로 반복 로그인 시
+    Oracle 왕복 없이 메모리에서 조회합니다.
+
+    - 조회 성공 결과와 '사용자 없음' 결과를 같은 ttl 동안 유지
+      (유지 시간이 다르면 캐시 적중 여부에 따른 응답 시간 차이로 사용자 존재 여부가 드러남)
+    - max_size 초과 시 가장 오래 사용되지 않은 항목부터 제거
+
+    get/set 사이에 await가 없으므로 이벤트 루프 안에서는 별도 Lock이 필요하지 않습니다.
+
+    Note:
+        레거시 TMS에서 직접 비밀번호를 변경한 경우 최대 ttl 동안
+        이전 비밀번호 해시가 사용될 수 있습니다.
+        마찬가지로 레거시 TMS에서 새로 생성된 사용자는 최대 ttl 동안
+        '사용자 없음'으로 조회될 수 있습니다.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        """
+        Args:
+            ttl: 조회 결과 유지 시간 (초)
+            max_size: 최대 항목 수
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, Optional[UserRecord]]] = OrderedDict()
+
+    def get(self, username: str) -> tuple[bool, Optional[UserRecord]]:
+        """
+        캐시된 조회 결과를 반환합니다.
+
+        Args:
+            username: 사용자 ID
+
+        Returns:
+            tuple[bool, Optional[UserRecord]]: (캐시 적중 여부, 사용자 정보)
+        """
+        entry = self._entries.get(username)
+        if entry is None:
+            return False, None
+
+        expires_at, user_record = entry
+        if expires_at <= time.monotonic():
+            del self._entries[username]
+            return False, None
+
+        self._entries.move_to_end(username)
+        return True, user_record
+
+    def set(self, username: str, user_record: Optional[UserRecord]) -> None:
+        """
+        조회 결과를 캐시에 저장합니다.
+
+        Args:
+            username: 사용자 ID
+            user_record: 사용자 정보 (없으면 None)
+        """
+        if self.ttl <= 0:
+            return
+
+        self._entries[username] = (time.monotonic() + self.ttl, user_record)
+        self._entries.move_to_end(username)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, username: str) -> None:
+        """
+        사용자의 캐시 항목을 제거합니다 (비밀번호 변경 시 등).
+
+        Args:
+            username: 사용자 ID
+        """
+        self._entries.pop(username, None)
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        self._entries.clear()
+
+
+# 프로세스 전역 사용자 조회 캐시
+user_record_cache = UserRecordCache(
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+)
+
 
 class AuthRepository:
     """
@@ -25,25 +144,35 @@ class AuthRepository:
     ORM 매핑 없이 Native Query(text)를 사용하여 빠른 개발을 지원합니다.
 
     책임:
-        - 사용자 조회 (username 기반)
+        - 사용자 조회 (username 기반, UserRecordCache 사용)
+        - 비밀번호 해시 갱신 (rehash)
         - Raw SQL 쿼리 실행
-        - 데이터베이스 결과를 Pydantic 스키마로 변환
+        - 데이터베이스 결과를 UserRecord로 변환
+
+    DB 연결을 보관하지 않으므로 하나의 인스턴스를 여러 요청에서 공유할 수 있습니다.
+    엔진은 메서드마다 인자로 전달하며, 연결은 쿼리를 실행할 때만 풀에서 꺼내
+    쿼리 직후 반환합니다. (캐시 적중 시에는 연결을 사용하지 않음)
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, cache: Optional[UserRecordCache] = None):
         """
         Args:
-            db: Oracle 데이터베이스 세션
+            cache: 사용자 조회 캐시 (기본값: 프로세스 전역 캐시)
         """
-        self.db = db
+        self.cache = cache if cache is not None else user_record_cache
 
-    async def find_user_by_username(self, username: str) -> Optional[UserRecord]:
+    async def find_user_by_username(
+        self,
+        db: AsyncEngine,
+        username: str
+    ) -> Optional[UserRecord]:
         """
         사용자 ID로 사용자 정보를 조회합니다.
 
         레거시 TMS Oracle DB에서 사용자 정보를 조회하는 Raw SQL 쿼리입니다.
 
         Args:
+            db: Oracle 데이터베이스 엔진 (get_oracle_engine)
             username: 사용자 ID
 
         Returns:
@@ -53,32 +182,36 @@ class AuthRepository:
             - 테이블명: T_USER (실제 테이블명으로 수정 필요)
             - 컬럼명: USER_ID, PASSWORD, USER_NAME (실제 컬럼명으로 수정 필요)
             - 쿼리는 placeholder를 사용하여 SQL Injection 방지
+            - Oracle(oracledb)에서는 드라이버 커서로 직접 실행하여
+              SQLAlchemy Row 생성 비용을 생략합니다 (_fetch_one_raw)
+            - 캐시에 있으면 DB를 조회하지 않습니다 (UserRecordCache)
         """
-        # TODO: 실제 테이블명과 컬럼명으로 수정 필요
-        # 현재는 placeholder 쿼리입니다.
-        # 예상 테이블: T_USER, T_MEMBER, USERS 등
-        # 예상 컬럼: USER_ID, USER_NAME, PASSWORD, PWD, PASSWD 등
-        query = text("""
-            SELECT
-                USER_ID,
-                PASSWORD,
-                USER_NAME
-            FROM T_USER
-            WHERE USER_ID = :username
-        """)
+        hit, cached_record = self.cache.get(username)
+        if hit:
+            return cached_record
+
+        params = {"username": username}
+        row: Optional[Sequence[Any]]
 
         try:
-            result = await self.db.execute(query, {"username": username})
-            row = result.fetchone()
+            async with db.connect() as conn:
+                if self._supports_driver_cursor(conn):
+                    row = await self._fetch_one_raw(conn, _FIND_USER_SQL, params)
+                else:
+                    result = await conn.execute(_FIND_USER_QUERY, params)
+                    row = result.fetchone()
 
             if row is None:
-                logger.info(
-                    f"User not found in Oracle DB",
-                    extra={"username": username}
-                )
+                # 조회 로그는 로그인마다 발생하므로 DEBUG 레벨에서만 기록
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "User not found in Oracle DB",
+                        extra={"username": username}
+                    )
+                self.cache.set(username, None)
                 return None
 
-            # Row를 Pydantic 모델로 변환
+            # Row를 UserRecord로 변환
             # row는 tuple 형태이므로 컬럼 순서에 맞춰 매핑
             user_record = UserRecord(
                 user_id=row[0],      # USER_ID
@@ -86,33 +219,120 @@ class AuthRepository:
                 user_name=row[2],    # USER_NAME
             )
 
-            logger.info(
-                f"User found in Oracle DB",
-                extra={
-                    "username": username,
-                    "user_name": user_record.user_name
-                }
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "User found in Oracle DB",
+                    extra={
+                        "username": username,
+                        "user_name": user_record.user_name
+                    }
+                )
 
+            self.cache.set(username, user_record)
             return user_record
 
         except Exception as e:
             logger.error(
-                f"Error querying Oracle DB for user",
+                "Error querying Oracle DB for user",
+                exc_info=True,
+                extra={"username": username, "error": str(e)}
+            )
+            raise
+
+    @staticmethod
+    def _supports_driver_cursor(conn: AsyncConnection) -> bool:
+        """
+        드라이버 커서를 직접 사용할 수 있는지 확인합니다.
+
+        SQL의 바인드 형식(:name)이 oracledb와 동일하므로
+        비동기 oracledb 드라이버일 때만 직접 실행합니다.
+        그 외 DB(테스트용 SQLite 등)는 SQLAlchemy 경로를 사용합니다.
+
+        Args:
+            conn: 데이터베이스 연결
+
+        Returns:
+            bool: 드라이버 커서 사용 가능 여부
+        """
+        dialect = conn.dialect
+        return dialect.name == "oracle" and dialect.driver == "oracledb" and bool(dialect.is_async)
+
+    @staticmethod
+    async def _fetch_one_raw(
+        conn: AsyncConnection,
+        sql: str,
+        params: dict[str, Any]
+    ) -> Optional[tuple]:
+        """
+        드라이버(oracledb) 커서로 쿼리를 실행하고 첫 번째 행을 반환합니다.
+
+        SQLAlchemy의 text() 컴파일과 Row 객체 생성을 거치지 않으므로
+        단순 조회 쿼리의 Python 측 오버헤드가 줄어듭니다.
+        드라이버 연결은 conn이 소유하므로 반환 처리는 conn이 담당합니다.
+
+        Args:
+            conn: Oracle 데이터베이스 연결
+            sql: 실행할 SQL (oracledb 바인드 형식)
+            params: 바인드 파라미터
+
+        Returns:
+            Optional[tuple]: 조회된 행 (없으면 None)
+        """
+        raw_connection = await conn.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None:
+            # 무효화(invalidate)된 연결
+            raise ConnectionError("Oracle driver connection is not available")
+
+        with driver_connection.cursor() as cursor:
+            await cursor.execute(sql, params)
+            row: Optional[tuple] = await cursor.fetchone()
+            return row
+
+    async def update_password(
+        self,
+        db: AsyncEngine,
+        username: str,
+        password_hash: str
+    ) -> None:
+        """
+        사용자의 저장된 비밀번호 해시를 갱신합니다.
+
+        로그인 성공 후 bcrypt cost 변경이나 평문 마이그레이션으로
+        재해싱이 필요할 때 사용합니다.
+
+        Args:
+            db: Oracle 데이터베이스 엔진
+            username: 사용자 ID
+            password_hash: 새 bcrypt 해시
+        """
+        try:
+            # 성공 시 커밋, 예외 시 롤백 후 연결 반환
+            async with db.begin() as conn:
+                await conn.execute(
+                    _UPDATE_PASSWORD_QUERY,
+                    {"password_hash": password_hash, "username": username}
+                )
+            self.cache.invalidate(username)
+
+        except Exception as e:
+            logger.error(
+                "Error updating password hash in Oracle DB",
                 exc_info=True,
                 extra={"username": username, "error": str(e)}
             )
             raise
 
-    async def verify_user_exists(self, username: str) -> bool:
+    async def verify_user_exists(self, db: AsyncEngine, username: str) -> bool:
         """
         사용자 존재 여부를 확인합니다.
 
         Args:
+            db: Oracle 데이터베이스 엔진
             username: 사용자 ID
 
         Returns:
             bool: 사용자 존재 여부
         """
-        user = await self.find_user_by_username(username)
+        user = await self.find_user_by_username(db, username)
         return user is not None
@@ -4,6 +4,8 @@ Auth Domain Schemas
 로그인 요청/응답 및 인증 관련 Pydantic 스키마를 정의합니다.
 """
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -56,7 +58,7 @@ class LoginResponse(BaseModel):
 
     user_id: str = Field(..., description="사용자 ID")
     user_name: str = Field(..., description="사용자 이름")
-    token: str = Field(..., description="임시 인증 토큰 (추후 JWT로 대체 예정)")
+    token: str = Field(..., description="JWT 액세스 토큰")
     message: str = Field(default="로그인 성공", description="응답 메시지")
 
     model_config = ConfigDict(
@@ -64,7 +66,7 @@ class LoginResponse(BaseModel):
             "example": {
                 "user_id": "user001",
                 "user_name": "홍길동",
-                "token": "temp_token_abc123",
+                "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "message": "로그인 성공"
             }
         }
@@ -76,15 +78,17 @@ class LoginResponse(BaseModel):
 # ====================
 
 
-class UserRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class UserRecord:
     """
     데이터베이스에서 조회된 사용자 레코드
 
     Repository에서 Service로 전달되는 내부 데이터 구조입니다.
+    API 입출력에 쓰이지 않고 DB에서 온 값을 그대로 담으므로 검증이 필요 없어,
+    Pydantic 모델 대신 __slots__ 기반 dataclass로 정의합니다.
+    (조회 캐시에 다수 보관되므로 인스턴스당 메모리도 줄어듭니다)
     """
 
-    user_id: str = Field(..., description="사용자 ID")
-    password: str = Field(..., description="암호화된 비밀번호")
-    user_name: str = Field(..., description="사용자 이름")
-
-    model_config = ConfigDict(from_attributes=True)
+    user_id: str  # 사용자 ID
+    password: str  # 암호화된 비밀번호
+    user_name: str  # 사용자 이름
@@ -4,20 +4,82 @@ Auth Domain Service
 레거시 TMS Oracle DB를 통한 사용자 로그인을 처리하는 서비스입니다.
 """
 
+import asyncio
+import hmac
+import logging
 import secrets
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession
+import bcrypt
+from jose import jwt
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from server.app.core.config import settings
 from server.app.core.logging import get_logger
+from server.app.core.rate_limit import RATE_LIMIT_MESSAGE, TokenBucketRateLimiter
+from server.app.domain.auth.passwords import (
+    BCRYPT_MAX_PASSWORD_BYTES,
+    HASH_PREFIX,
+    LEGACY_BCRYPT_PREFIXES,
+    get_bcrypt_cost,
+    hash_password,
+    prehash_password,
+)
+from server.app.domain.auth.repositories import AuthRepository
+from server.app.domain.auth.schemas import LoginRequest, LoginResponse
 from server.app.shared.base import BaseService
+from server.app.shared.exceptions import (
+    NotFoundException,
+    TooManyRequestsException,
+    UnauthorizedException,
+    ValidationException,
+)
 from server.app.shared.types import ServiceResult
-from server.app.shared.exceptions import ValidationException, NotFoundException
-from server.app.domain.auth.schemas import LoginRequest, LoginResponse
-from server.app.domain.auth.repositories import AuthRepository
 
 logger = get_logger(__name__)
 
+# 존재하지 않는 사용자 로그인 시 검증에 사용할 더미 해시
+# 실제 사용자와 같은 cost로 생성하여 검증 시간을 동일하게 맞춥니다.
+INVALID_HASH = hash_password("invalid", settings.BCRYPT_COST)
+
+# 로그인 실패 응답에 추가하는 지연 시간 상한 (ms)
+_FAILURE_JITTER_MAX_MS = 20
+
+# JWT 서명 설정 (요청마다 설정을 읽지 않도록 모듈 로드 시 고정)
+_JWT_ALGORITHM = "HS256"
+_JWT_SECRET_KEY = settings.SECRET_KEY
+_ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+# 사용자 ID별 로그인 시도 제한 (여러 IP에 분산된 대입 공격 대비)
+username_rate_limiter = TokenBucketRateLimiter(
+    capacity=settings.AUTH_LOGIN_RATE_LIMIT_PER_USERNAME,
+    period=settings.AUTH_LOGIN_RATE_LIMIT_PERIOD_SECONDS,
+)
+
+# 응답을 기다리지 않고 실행 중인 후처리 태스크
+# (이벤트 루프는 태스크를 약한 참조로만 보관하므로 완료 전까지 참조를 유지)
+_background_tasks: set[asyncio.Task] = set()
+
+# 고정 에러 메시지 (Router에서 미리 직렬화하여 사용)
+INVALID_CREDENTIALS_MESSAGE = "사용자 ID 또는 비밀번호가 올바르지 않습니다"
+LOGIN_ERROR_MESSAGE = "로그인 처리 중 오류가 발생했습니다"
+
+
+def _log_background_error(task: asyncio.Task) -> None:
+    """
+    후처리 태스크 완료 시 참조를 해제하고, 예외가 있으면 기록합니다.
+
+    Args:
+        task: 완료된 태스크
+    """
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "Background task failed",
+            exc_info=task.exception()
+        )
+
 
 class AuthService(BaseService[LoginRequest, LoginResponse]):
     """
@@ -28,35 +90,42 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
     책임:
         - 사용자 로그인 검증
         - 비밀번호 확인
-        - 임시 토큰 생성 (추후 JWT로 대체 예정)
+        - 비밀번호 재해싱 (bcrypt cost 변경, 평문 마이그레이션)
+        - 액세스 토큰(JWT) 생성
 
     흐름:
         1. 요청 검증
         2. 사용자 조회 (Repository)
-        3. 비밀번호 검증 (현재는 더미)
-        4. 토큰 생성
-        5. 응답 반환
+        3. 비밀번호 검증 (bcrypt, 레거시 bcrypt/평문 호환)
+        4. 필요 시 비밀번호 재해싱
+        5. 토큰 생성
+        6. 응답 반환
+
+    요청별 상태를 갖지 않으므로 Router에서 모듈 로드 시 한 번만 생성하고,
+    DB 엔진은 execute 호출마다 인자로 전달합니다.
     """
 
-    def __init__(self, db: AsyncSession):
-        """
-        Args:
-            db: Oracle 데이터베이스 세션
-        """
-        super().__init__(db)
-        self.repository = AuthRepository(db)
+    def __init__(self) -> None:
+        # DB 엔진은 요청마다 execute(request, db=...)로 전달받으므로 self.db는 사용하지 않습니다.
+        super().__init__()
+        self.repository = AuthRepository()
+        self.bcrypt_cost = settings.BCRYPT_COST
+        self.username_rate_limiter = username_rate_limiter
 
     async def execute(
         self,
         request: LoginRequest,
+        *,
+        db: AsyncEngine,
         user_id: Optional[int] = None,
-        **kwargs
+        **kwargs: Any
     ) -> ServiceResult[LoginResponse]:
         """
         로그인 요청을 실행합니다.
 
         Args:
             request: 로그인 요청 (username, password)
+            db: Oracle 데이터베이스 엔진 (get_oracle_engine)
             user_id: 요청한 사용자 ID (선택, 로그인에서는 사용하지 않음)
             **kwargs: 추가 컨텍스트
 
@@ -66,6 +135,8 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
         Raises:
             ValidationException: 입력 검증 실패
             NotFoundException: 사용자를 찾을 수 없음
+            UnauthorizedException: 비밀번호 불일치
+            TooManyRequestsException: 사용자 ID별 시도 횟수 초과
         """
         try:
             # 실행 전 훅
@@ -74,10 +145,45 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
             # 1. 요청 검증
             await self.validate_request(request)
 
+            # 사용자 ID별 시도 횟수 제한 (DB 조회/bcrypt 비용 발생 전에 거부)
+            retry_after = self.username_rate_limiter.acquire(request.username)
+            if retry_after > 0:
+                logger.warning(
+                    "Login rate limit exceeded",
+                    extra={"username": request.username}
+                )
+                raise TooManyRequestsException(
+                    RATE_LIMIT_MESSAGE,
+                    details={"retry_after": retry_after}
+                )
+
             # 2. 사용자 조회 (Repository)
-            user_record = await self.repository.find_user_by_username(request.username)
+            # 조회를 먼저 시작하고, DB 응답을 기다리는 동안 토큰을 서명합니다.
+            # 조회 조건이 USER_ID = username이므로 토큰 subject는 조회 전에 확정됩니다.
+            # 로그인 실패 요청도 서명 비용(HS256, 수십 µs)을 지불하지만,
+            # bcrypt 검증(수백 ms)에 비해 무시할 수 있어 성공 경로의 지연 단축을 택했습니다.
+            lookup = asyncio.create_task(
+                self.repository.find_user_by_username(db, request.username)
+            )
+            try:
+                # 조회 태스크가 쿼리를 전송하고 응답 대기에 들어가도록 한 번 양보
+                await asyncio.sleep(0)
+                token = self._generate_access_token(request.username)
+
+                user_record = await lookup
+            finally:
+                # 요청 취소(클라이언트 연결 종료 등)나 토큰 생성 실패로 빠져나가면
+                # 조회 태스크를 취소하고 종료를 기다립니다.
+                # (요청이 끝난 뒤에도 조회 태스크가 풀의 연결을 점유하지 않도록 함)
+                if not lookup.done():
+                    lookup.cancel()
+                    await asyncio.wait([lookup])
 
             if user_record is None:
+                # 사용자가 없어도 동일한 bcrypt 검증 비용을 지불하여
+                # 응답 시간으로 사용자 존재 여부를 추측할 수 없게 합니다.
+                await self._verify_password(request.password, INVALID_HASH)
+                await self._failure_jitter()
                 logger.warning(
                     "Login failed: User not found",
                     extra={"username": request.username}
@@ -88,19 +194,26 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
 
             # 3. 비밀번호 검증
             if not await self._verify_password(request.password, user_record.password):
+                await self._failure_jitter()
                 logger.warning(
                     "Login failed: Invalid password",
                     extra={"username": request.username}
                 )
-                raise ValidationException(
+                raise UnauthorizedException(
                     message="비밀번호가 일치하지 않습니다"
                 )
 
-            # 4. 토큰 생성 (임시)
-            token = self._generate_temp_token()
+            # 4. 필요 시 비밀번호 재해싱
+            await self._check_needs_rehash(
+                db,
+                request.password,
+                user_record.user_id,
+                user_record.password
+            )
 
-            # 5. 응답 생성
-            response = LoginResponse(
+            # 5. 응답 생성 (토큰은 사용자 조회와 함께 생성됨)
+            # 모든 필드가 검증된 값이므로 재검증 없이 생성 (model_construct)
+            response = LoginResponse.model_construct(
                 user_id=user_record.user_id,
                 user_name=user_record.user_name,
                 token=token,
@@ -116,20 +229,30 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
                 }
             )
 
-            logger.info(
-                "Login successful",
-                extra={
-                    "username": request.username,
-                    "user_id": user_record.user_id,
-                }
-            )
+            # 요청 단위 결과(경로, 상태 코드)는 RequestIDMiddleware가 기록하므로
+            # 성공 로그는 DEBUG 레벨에서만 남깁니다.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Login successful",
+                    extra={
+                        "username": request.username,
+                        "user_id": user_record.user_id,
+                    }
+                )
 
-            # 실행 후 훅
-            await self.after_execute(request, result)
+            # 실행 후 훅 (메트릭/감사 기록이 응답을 지연시키지 않도록 백그라운드 실행)
+            task = asyncio.create_task(self.after_execute(request, result))
+            _background_tasks.add(task)
+            task.add_done_callback(_log_background_error)
 
             return result
 
-        except (ValidationException, NotFoundException) as e:
+        except (
+            ValidationException,
+            NotFoundException,
+            UnauthorizedException,
+            TooManyRequestsException,
+        ) as e:
             # 예상된 예외는 그대로 전달
             return await self.handle_error(e, request)
         except Exception as e:
@@ -163,42 +286,158 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
         """
         비밀번호를 검증합니다.
 
-        현재는 더미 구현입니다. 레거시 시스템의 암호화 방식을 확인한 후
-        실제 암호화 검증 로직으로 대체해야 합니다.
+        저장된 값의 형식에 따라 검증합니다.
+            - $bcrypt-sha256$...: 이 서비스가 생성한 해시.
+              prehash_password(SHA-256 hex)로 변환한 입력을 bcrypt.checkpw로 검증
+              (72바이트 절단 문제 회피)
+            - $2a$/$2b$/$2y$...: 레거시 bcrypt 해시. 원문 비밀번호로 검증
+              (레거시 해시 생성 시와 같이 앞 72바이트만 사용)
+            - 그 외: 레거시 평문. hmac.compare_digest로 상수 시간 비교
+
+        레거시 평문은 bcrypt 연산 없이 비교되므로 INVALID_HASH도 함께 검증하여,
+        사용자 없음/비밀번호 불일치 경로의 응답 시간이 같아지도록 합니다.
+        레거시 bcrypt·이전 cost 해시는 저장된 해시의 cost만큼만 비용을 지불하므로
+        응답 시간이 사용자 없음 경로와 다를 수 있습니다. (재해싱 후 해소)
 
-        TODO: 레거시 시스템의 암호화 방식 확인 후 구현
-            - MD5, SHA-1, SHA-256 등의 해시 알고리즘
-            - bcrypt, PBKDF2 등의 key derivation 함수
-            - 평문 저장 (보안상 권장하지 않음)
+        bcrypt 연산은 CPU 바운드이므로 이벤트 루프를 막지 않도록 별도 스레드에서 실행합니다.
 
         Args:
             input_password: 사용자가 입력한 비밀번호
-            stored_password: DB에 저장된 비밀번호
+            stored_password: DB에 저장된 비밀번호 (해시, 레거시 bcrypt 또는 레거시 평문)
 
         Returns:
             bool: 비밀번호 일치 여부
         """
-        # 임시 구현: 평문 비교 (나중에 수정 필요)
-        # 실제로는 레거시 시스템의 암호화 방식에 맞춰 검증해야 함
-        return input_password == stored_password
+        if stored_password.startswith(HASH_PREFIX):
+            matched = await self._bcrypt_checkpw(
+                prehash_password(input_password),
+                stored_password[len(HASH_PREFIX):],
+            )
+        elif stored_password.startswith(LEGACY_BCRYPT_PREFIXES):
+            # 레거시 해시는 72바이트 이후가 무시된 채 생성되었으므로 동일하게 절단
+            # (bcrypt 5.x는 72바이트 초과 입력을 거부)
+            matched = await self._bcrypt_checkpw(
+                input_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+                stored_password,
+            )
+        else:
+            # 레거시 평문 비밀번호 (마이그레이션 기간 한정)
+            matched = hmac.compare_digest(
+                input_password.encode("utf-8"),
+                stored_password.encode("utf-8"),
+            )
+            # bcrypt 연산을 하지 않았으므로 더미 해시를 검증하여 현재 cost 비용을 지불
+            # (평문 불일치가 즉시 반환되면 응답 시간으로 실제 계정이 드러남)
+            await self._bcrypt_checkpw(
+                prehash_password(input_password),
+                INVALID_HASH[len(HASH_PREFIX):],
+            )
+
+        return matched
+
+    async def _bcrypt_checkpw(self, password: bytes, bcrypt_hash: str) -> bool:
+        """
+        bcrypt.checkpw를 별도 스레드에서 실행합니다.
 
-    def _generate_temp_token(self) -> str:
+        Args:
+            password: bcrypt 입력 바이트
+            bcrypt_hash: bcrypt 해시 ($2a$/$2b$/$2y$...)
+
+        Returns:
+            bool: 일치 여부 (손상된 해시, 72바이트 초과 입력은 False)
         """
-        임시 토큰을 생성합니다.
+        if len(password) > BCRYPT_MAX_PASSWORD_BYTES:
+            # 호출부에서 prehash 또는 절단하므로 정상 흐름에서는 발생하지 않음
+            logger.warning("bcrypt input exceeds 72 bytes")
+            return False
 
-        현재는 단순한 랜덤 문자열을 생성합니다.
-        추후 JWT 기반 토큰으로 대체할 예정입니다.
+        try:
+            return await asyncio.to_thread(
+                bcrypt.checkpw,
+                password,
+                bcrypt_hash.encode("utf-8"),
+            )
+        except ValueError:
+            # 손상된 해시 값 (salt 형식 오류 등)
+            logger.warning("Invalid bcrypt hash format in stored password")
+            return False
 
-        TODO: JWT 토큰 생성 구현
-            - python-jose 라이브러리 사용
-            - 토큰에 user_id, exp 등의 클레임 포함
-            - 액세스 토큰 + 리프레시 토큰 구조
+    async def _failure_jitter(self) -> None:
+        """
+        로그인 실패 시 0~20ms의 무작위 지연을 추가합니다.
+
+        실패 경로 간 남은 미세한 시간 차이를 측정하기 어렵게 만듭니다.
+        """
+        await asyncio.sleep(secrets.randbelow(_FAILURE_JITTER_MAX_MS + 1) / 1000)
+
+    async def _check_needs_rehash(
+        self,
+        db: AsyncEngine,
+        input_password: str,
+        user_id: str,
+        stored_password: str
+    ) -> bool:
+        """
+        저장된 비밀번호가 재해싱 대상이면 현재 설정으로 다시 해싱하여 저장합니다.
+
+        로그인에 성공한 직후에만 호출됩니다 (평문 비밀번호를 알고 있는 유일한 시점).
+        재해싱 대상:
+            - 레거시 평문 비밀번호
+            - 레거시 bcrypt 해시 (원문 비밀번호 기반, 식별자 없음)
+            - bcrypt cost가 settings.BCRYPT_COST와 다른 해시
+
+        재해싱 실패는 로그인 결과에 영향을 주지 않습니다.
+
+        Args:
+            db: Oracle 데이터베이스 엔진
+            input_password: 검증을 통과한 평문 비밀번호
+            user_id: 사용자 ID
+            stored_password: DB에 저장된 비밀번호
+
+        Returns:
+            bool: 재해싱 수행 여부
+        """
+        if get_bcrypt_cost(stored_password) == self.bcrypt_cost:
+            return False
+
+        try:
+            new_hash = await asyncio.to_thread(hash_password, input_password, self.bcrypt_cost)
+            await self.repository.update_password(db, user_id, new_hash)
+        except Exception:
+            logger.warning(
+                "Password rehash failed",
+                exc_info=True,
+                extra={"user_id": user_id}
+            )
+            return False
+
+        logger.info(
+            "Password rehashed",
+            extra={"user_id": user_id, "bcrypt_cost": self.bcrypt_cost}
+        )
+        return True
+
+    def _generate_access_token(self, user_id: str) -> str:
+        """
+        JWT 액세스 토큰을 생성합니다.
+
+        HS256(HMAC-SHA256)으로 서명하며, 만료 시간(exp)을 토큰에 포함하므로
+        서버 측 세션 상태가 필요하지 않습니다.
+
+        Args:
+            user_id: 토큰 주체(sub)가 될 사용자 ID
 
         Returns:
-            str: 임시 인증 토큰
+            str: 서명된 JWT 액세스 토큰
         """
-        # 임시 구현: 안전한 랜덤 문자열
-        return f"temp_token_{secrets.token_urlsafe(32)}"
+        now = datetime.now(timezone.utc)
+        claims = {
+            "sub": user_id,
+            "iat": now,
+            "exp": now + _ACCESS_TOKEN_EXPIRE,
+        }
+        token: str = jwt.encode(claims, _JWT_SECRET_KEY, algorithm=_JWT_ALGORITHM)
+        return token
 
     async def handle_error(
         self,
@@ -218,22 +457,37 @@ class AuthService(BaseService[LoginRequest, LoginResponse]):
         # 에러 로깅 (비밀번호는 로그에서 제외)
         logger.error(
             f"Error in AuthService: {str(error)}",
-            exc_info=isinstance(error, Exception) and not isinstance(error, (ValidationException, NotFoundException)),
+            exc_info=not isinstance(
+                error,
+                (
+                    ValidationException,
+                    NotFoundException,
+                    UnauthorizedException,
+                    TooManyRequestsException,
+                )
+            ),
             extra={"username": request.username}
         )
 
         # 에러 타입에 따라 다른 메시지 반환
-        if isinstance(error, ValidationException):
+        if isinstance(error, (ValidationException, TooManyRequestsException)):
             error_message = str(error)
-        elif isinstance(error, NotFoundException):
-            error_message = "사용자 ID 또는 비밀번호가 올바르지 않습니다"  # 보안상 모호하게 표현
+        elif isinstance(error, (NotFoundException, UnauthorizedException)):
+            # 사용자 없음/비밀번호 불일치를 구분할 수 없도록 동일한 메시지 사용
+            error_message = INVALID_CREDENTIALS_MESSAGE
         else:
-            error_message = "로그인 처리 중 오류가 발생했습니다"
+            error_message = LOGIN_ERROR_MESSAGE
+
+        metadata = {
+            "error_type": type(error).__name__,
+            "username": request.username,
+        }
+        if isinstance(error, TooManyRequestsException):
+            # Router에서 Retry-After 헤더로 전달
+            metadata["retry_after"] = error.details.get("retry_after", 0)
 
         return ServiceResult.fail(
             error_message,
-            metadata={
-                "error_type": type(error).__name__,
-                "username": request.username,
-            }
+            metadata=metadata,
+            error_type=type(error),
         )
@@ -365,7 +365,8 @@ class SampleDomainService(BaseService[SampleAnalysisRequest, SampleAnalysisRespo
             metadata={
                 "error_type": type(error).__name__,
                 "data_id": request.data_id,
-            }
+            },
+            error_type=type(error),
         )
 
 
@@ -542,5 +543,6 @@ class SimpleGetService(BaseService[None, SampleListResponse]):
             error_message,
             metadata={
                 "error_type": type(error).__name__,
-            }
+            },
+            error_type=type(error),
         )
@@ -72,15 +72,21 @@ class BaseService(ABC, Generic[TRequest, TResponse]):
                 return ServiceResult.ok(formatted_response)
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: Optional[AsyncSession] = None):
         """
         Args:
             db: 데이터베이스 세션
+                (연결을 execute 인자로 전달받는 상태 없는 서비스는 생략)
         """
         self.db = db
 
     @abstractmethod
-    async def execute(self, request: TRequest, **kwargs: Any) -> ServiceResult[TResponse]:
+    async def execute(
+        self,
+        request: TRequest,
+        *args: Any,
+        **kwargs: Any
+    ) -> ServiceResult[TResponse]:
         """
         서비스의 주요 비즈니스 로직을 실행합니다.
 
@@ -113,6 +119,7 @@ class BaseService(ABC, Generic[TRequest, TResponse]):
 
         Args:
             request: 요청 데이터
+            *args: 서비스별 추가 인자 (요청마다 전달받는 DB 연결 등)
             **kwargs: 추가 컨텍스트 정보 (user_id, request_id 등)
 
         Returns:
@@ -233,7 +240,7 @@ class BaseService(ABC, Generic[TRequest, TResponse]):
             - 사용자 친화적 에러 메시지 생성
             - 에러 추적 시스템 연동
         """
-        return ServiceResult.fail(str(error))
+        return ServiceResult.fail(str(error), error_type=type(error))
 
 
 class CRUDService(BaseService[TRequest, TResponse], ABC):
@@ -77,6 +77,17 @@ class ForbiddenException(ApplicationException):
         super().__init__(message, status_code=403, details=details)
 
 
+class TooManyRequestsException(ApplicationException):
+    """
+    요청 제한 초과 예외
+
+    단위 시간당 허용된 요청 수를 초과했을 때 발생합니다.
+    """
+
+    def __init__(self, message: str = "Too Many Requests", details: Optional[dict[str, Any]] = None):
+        super().__init__(message, status_code=429, details=details)
+
+
 class BusinessLogicException(ApplicationException):
     """
     비즈니스 로직 예외
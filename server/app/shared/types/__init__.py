@@ -4,7 +4,7 @@
 도메인 전반에서 사용되는 타입 힌트와 타입 별칭을 정의합니다.
 """
 
-from typing import Any, TypeVar, Generic
+from typing import Any, Generic, NamedTuple, TypeVar
 from pydantic import BaseModel
 
 
@@ -23,27 +23,37 @@ TData = TypeVar("TData")  # 데이터 타입
 # ====================
 
 
-class ServiceResult(BaseModel, Generic[T]):
+class ServiceResult(NamedTuple, Generic[T]):
     """
     서비스 계층 결과 래퍼
 
     서비스 메서드의 실행 결과를 성공/실패 상태와 함께 반환합니다.
+
+    요청마다 생성되는 값이므로 Pydantic 모델 대신 NamedTuple로 정의하여
+    생성/필드 접근 비용을 줄입니다. 필드는 이름으로 접근하세요. (result.data 등)
+    API 응답으로 직렬화하지 않으며, Router에서 data를 꺼내 반환합니다.
     """
 
     success: bool
     data: T | None = None
     error: str | None = None
     metadata: dict[str, Any] | None = None
+    error_type: type[Exception] | None = None  # 실패 원인 예외 클래스 (HTTP 상태 코드 매핑용)
 
     @classmethod
     def ok(cls, data: T, metadata: dict[str, Any] | None = None) -> "ServiceResult[T]":
         """성공 결과 생성"""
-        return cls(success=True, data=data, metadata=metadata)
+        return cls(True, data, None, metadata)
 
     @classmethod
-    def fail(cls, error: str, metadata: dict[str, Any] | None = None) -> "ServiceResult[T]":
+    def fail(
+        cls,
+        error: str,
+        metadata: dict[str, Any] | None = None,
+        error_type: type[Exception] | None = None,
+    ) -> "ServiceResult[T]":
         """실패 결과 생성"""
-        return cls(success=False, error=error, metadata=metadata)
+        return cls(False, None, error, metadata, error_type)
 
 
 class PaginatedResult(BaseModel, Generic[T]):
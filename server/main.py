@@ -8,7 +8,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
@@ -116,6 +116,7 @@ def create_application() -> FastAPI:
         """,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,  # orjson 기반 JSON 직렬화
         # docs_url="/docs" if settings.DEBUG else None,  # 운영에서는 문서 비활성화 가능
         # redoc_url="/redoc" if settings.DEBUG else None,
     )
@@ -160,7 +161,7 @@ def create_application() -> FastAPI:
     async def application_exception_handler(
         request: Request,
         exc: ApplicationException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """
         애플리케이션 예외 핸들러
 
@@ -180,7 +181,7 @@ def create_application() -> FastAPI:
             }
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": exc.message,
@@ -192,7 +193,7 @@ def create_application() -> FastAPI:
     async def general_exception_handler(
         request: Request,
         exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """
         일반 예외 핸들러
 
@@ -215,7 +216,7 @@ def create_application() -> FastAPI:
 
         # 개발 환경에서는 상세 에러 표시
         if settings.DEBUG:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": "Internal server error",
@@ -227,7 +228,7 @@ def create_application() -> FastAPI:
             )
 
         # 운영 환경에서는 간단한 에러 메시지만
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
@@ -10,7 +10,12 @@ from typing import AsyncGenerator, Generator
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
 
 from server.main import app
 from server.app.core.database import Base, get_db
@@ -79,6 +84,16 @@ async def test_db() -> AsyncGenerator[AsyncSession, None]:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(scope="function")
+def test_oracle_engine() -> AsyncEngine:
+    """
+    테스트용 데이터베이스 엔진을 제공합니다.
+
+    세션 없이 엔진에서 연결을 직접 꺼내 쓰는 Repository(get_oracle_engine 대체) 테스트용입니다.
+    """
+    return test_engine
+
+
 # ====================
 # FastAPI Client Fixtures
 # ====================
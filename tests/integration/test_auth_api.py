@@ -0,0 +1,152 @@
+"""
+Auth Domain API 통합 테스트
+
+레거시 TMS 로그인 엔드포인트의 전체 흐름을 테스트합니다.
+Oracle DB 대신 테스트용 SQLite DB에 T_USER 테이블을 만들어 사용합니다.
+"""
+
+from typing import AsyncGenerator
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from jose import jwt
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from server.app.core.config import settings
+from server.app.core.database import get_oracle_engine
+from server.app.core.rate_limit import RATE_LIMIT_MESSAGE, TokenBucketRateLimiter
+from server.app.domain.auth import _AUTH_SERVICE, login_ip_rate_limiter
+from server.app.domain.auth.passwords import hash_password
+from server.app.domain.auth.repositories import user_record_cache
+from server.app.domain.auth.service import username_rate_limiter
+from server.main import app
+
+LOGIN_URL = "/api/v1/auth/login"
+
+
+@pytest.fixture
+async def auth_client(test_oracle_engine: AsyncEngine) -> AsyncGenerator[AsyncClient, None]:
+    """
+    테스트 DB를 Oracle DB 대신 사용하는 비동기 테스트 클라이언트를 제공합니다.
+    """
+    password_hash = hash_password("password123", 4)
+
+    async with test_oracle_engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE T_USER (USER_ID TEXT PRIMARY KEY, PASSWORD TEXT, USER_NAME TEXT)"
+        ))
+        await conn.execute(
+            text("INSERT INTO T_USER VALUES ('user001', :password, '홍길동')"),
+            {"password": password_hash},
+        )
+
+    app.dependency_overrides[get_oracle_engine] = lambda: test_oracle_engine
+    user_record_cache.clear()
+    login_ip_rate_limiter.clear()
+    username_rate_limiter.clear()
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        yield ac
+
+    app.dependency_overrides.clear()
+    user_record_cache.clear()
+    login_ip_rate_limiter.clear()
+    username_rate_limiter.clear()
+
+    async with test_oracle_engine.begin() as conn:
+        await conn.execute(text("DROP TABLE T_USER"))
+
+
+@pytest.mark.integration
+class TestLoginAPI:
+    """
+    로그인 API 테스트
+    """
+
+    async def test_login_success(self, auth_client: AsyncClient):
+        response = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "user001", "password": "password123"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["user_id"] == "user001"
+        assert data["user_name"] == "홍길동"
+        claims = jwt.decode(data["token"], settings.SECRET_KEY, algorithms=["HS256"])
+        assert claims["sub"] == "user001"
+
+    async def test_login_wrong_password(self, auth_client: AsyncClient):
+        response = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "user001", "password": "wrong"},
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["detail"] == "사용자 ID 또는 비밀번호가 올바르지 않습니다"
+
+    async def test_login_unknown_user(self, auth_client: AsyncClient):
+        response = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "nobody", "password": "password123"},
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["detail"] == "사용자 ID 또는 비밀번호가 올바르지 않습니다"
+
+    async def test_login_blank_username(self, auth_client: AsyncClient):
+        response = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "   ", "password": "password123"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_login_invalid_body(self, auth_client: AsyncClient):
+        response = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "user001"},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_login_rate_limited_per_ip(self, auth_client: AsyncClient):
+        """같은 IP에서 한도를 넘으면 429 + Retry-After"""
+        for _ in range(settings.AUTH_LOGIN_RATE_LIMIT_PER_IP):
+            response = await auth_client.post(
+                LOGIN_URL,
+                json={"username": "user001", "password": "wrong"},
+            )
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "user001", "password": "password123"},
+        )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) > 0
+
+    async def test_login_rate_limited_per_username(self, auth_client: AsyncClient, monkeypatch):
+        """사용자 ID 한도 초과도 429 + Retry-After"""
+        monkeypatch.setattr(
+            _AUTH_SERVICE,
+            "username_rate_limiter",
+            TokenBucketRateLimiter(capacity=1, period=60),
+        )
+
+        first = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "user001", "password": "wrong"},
+        )
+        response = await auth_client.post(
+            LOGIN_URL,
+            json={"username": "user001", "password": "password123"},
+        )
+
+        assert first.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json()["detail"] == RATE_LIMIT_MESSAGE
+        assert int(response.headers["Retry-After"]) == 60
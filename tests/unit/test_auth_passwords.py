@@ -0,0 +1,71 @@
+"""
+Auth Domain Password Hashing 단위 테스트
+
+해시 형식과 마이그레이션용 배치 해싱을 테스트합니다.
+"""
+
+import bcrypt
+import pytest
+
+from server.app.domain.auth.passwords import (
+    HASH_PREFIX,
+    generate_bcrypt_salts,
+    get_bcrypt_cost,
+    hash_password,
+    hash_passwords,
+    prehash_password,
+)
+
+
+@pytest.mark.unit
+class TestHashPassword:
+    """
+    hash_password / get_bcrypt_cost 테스트
+    """
+
+    def test_format(self):
+        hashed = hash_password("password123", cost=4)
+
+        assert hashed.startswith(HASH_PREFIX + "$2b$04$")
+        assert get_bcrypt_cost(hashed) == 4
+
+    def test_legacy_values_have_no_cost(self):
+        legacy = bcrypt.hashpw(b"password123", bcrypt.gensalt(4)).decode("utf-8")
+
+        assert get_bcrypt_cost(legacy) is None
+        assert get_bcrypt_cost("plaintext") is None
+
+
+@pytest.mark.unit
+class TestBatchHashing:
+    """
+    generate_bcrypt_salts / hash_passwords 테스트
+    """
+
+    def test_salt_format(self):
+        salts = generate_bcrypt_salts(3, cost=4)
+
+        assert len(salts) == 3
+        assert len(set(salts)) == 3
+        for salt in salts:
+            assert salt.startswith(b"$2b$04$")
+            assert len(salt) == 29
+
+    def test_salts_usable_by_bcrypt(self):
+        for salt in generate_bcrypt_salts(5, cost=4):
+            hashed = bcrypt.hashpw(b"password123", salt)
+
+            assert hashed.startswith(salt)
+            assert bcrypt.checkpw(b"password123", hashed)
+
+    def test_hash_passwords(self):
+        hashes = hash_passwords(["a", "b"], cost=4)
+
+        assert [get_bcrypt_cost(hashed) for hashed in hashes] == [4, 4]
+        for password, hashed in zip(["a", "b"], hashes, strict=True):
+            assert bcrypt.checkpw(
+                prehash_password(password), hashed.removeprefix(HASH_PREFIX).encode("utf-8")
+            )
+        assert not bcrypt.checkpw(
+            prehash_password("a"), hashes[1].removeprefix(HASH_PREFIX).encode("utf-8")
+        )
@@ -0,0 +1,158 @@
+"""
+Auth Domain Repository 단위 테스트
+
+테스트용 SQLite DB와 사용자 조회 캐시 동작을 테스트합니다.
+"""
+
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from server.app.domain.auth.repositories import AuthRepository, UserRecordCache
+from server.app.domain.auth.schemas import UserRecord
+
+
+@pytest.fixture
+async def user_engine(test_oracle_engine: AsyncEngine) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    레거시 T_USER 테이블을 가진 테스트 DB 엔진을 제공합니다.
+    """
+    async with test_oracle_engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE T_USER (USER_ID TEXT PRIMARY KEY, PASSWORD TEXT, USER_NAME TEXT)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO T_USER VALUES ('user001', 'password123', '홍길동')"
+        ))
+
+    yield test_oracle_engine
+
+    async with test_oracle_engine.begin() as conn:
+        await conn.execute(text("DROP TABLE T_USER"))
+
+
+class _UnavailableEngine:
+    """연결을 꺼내면 실패하는 엔진 (캐시 적중 시 연결 미사용 확인용)"""
+
+    def connect(self):
+        raise AssertionError("connection checked out on cache hit")
+
+
+@pytest.fixture
+def cache() -> UserRecordCache:
+    return UserRecordCache(ttl=60, max_size=100)
+
+
+@pytest.mark.unit
+class TestFindUserByUsername:
+    """
+    AuthRepository.find_user_by_username 테스트
+    """
+
+    async def test_found(self, user_engine: AsyncEngine, cache: UserRecordCache):
+        repository = AuthRepository(cache=cache)
+
+        user_record = await repository.find_user_by_username(user_engine, "user001")
+
+        assert user_record == UserRecord(
+            user_id="user001", password="password123", user_name="홍길동"
+        )
+
+    async def test_not_found(self, user_engine: AsyncEngine, cache: UserRecordCache):
+        repository = AuthRepository(cache=cache)
+
+        assert await repository.find_user_by_username(user_engine, "nobody") is None
+
+    async def test_cached(self, user_engine: AsyncEngine, cache: UserRecordCache):
+        """두 번째 조회는 DB 대신 캐시에서 반환"""
+        repository = AuthRepository(cache=cache)
+        await repository.find_user_by_username(user_engine, "user001")
+        await repository.find_user_by_username(user_engine, "nobody")
+
+        async with user_engine.begin() as conn:
+            await conn.execute(text("DELETE FROM T_USER"))
+
+        assert (await repository.find_user_by_username(user_engine, "user001")).user_name == "홍길동"
+        assert await repository.find_user_by_username(user_engine, "nobody") is None
+
+    async def test_cache_hit_skips_connection(
+        self,
+        user_engine: AsyncEngine,
+        cache: UserRecordCache,
+    ):
+        """캐시 적중 시 풀에서 연결을 꺼내지 않음"""
+        repository = AuthRepository(cache=cache)
+        await repository.find_user_by_username(user_engine, "user001")
+
+        user_record = await repository.find_user_by_username(_UnavailableEngine(), "user001")
+
+        assert user_record.user_name == "홍길동"
+
+    async def test_update_password_invalidates_cache(
+        self,
+        user_engine: AsyncEngine,
+        cache: UserRecordCache,
+    ):
+        """비밀번호 갱신 시 캐시 항목 제거"""
+        repository = AuthRepository(cache=cache)
+        await repository.find_user_by_username(user_engine, "user001")
+
+        await repository.update_password(user_engine, "user001", "new_hash")
+
+        assert (await repository.find_user_by_username(user_engine, "user001")).password == "new_hash"
+
+
+@pytest.mark.unit
+class TestUserRecordCache:
+    """
+    UserRecordCache 테스트
+    """
+
+    def _record(self, user_id: str) -> UserRecord:
+        return UserRecord(user_id=user_id, password="pw", user_name="name")
+
+    def test_miss(self, cache: UserRecordCache):
+        assert cache.get("user001") == (False, None)
+
+    def test_negative_entry(self, cache: UserRecordCache):
+        """'사용자 없음' 결과도 캐시 적중으로 구분"""
+        cache.set("nobody", None)
+
+        assert cache.get("nobody") == (True, None)
+
+    def test_expired(self, monkeypatch):
+        """조회 성공 결과와 '사용자 없음' 결과가 같은 시점에 만료"""
+        now = [1000.0]
+        monkeypatch.setattr(
+            "server.app.domain.auth.repositories.time.monotonic", lambda: now[0]
+        )
+        cache = UserRecordCache(ttl=60, max_size=100)
+        cache.set("user001", self._record("user001"))
+        cache.set("nobody", None)
+
+        now[0] += 59
+        assert cache.get("user001")[0] is True
+        assert cache.get("nobody") == (True, None)
+
+        now[0] += 2
+        assert cache.get("user001") == (False, None)
+        assert cache.get("nobody") == (False, None)
+
+    def test_zero_ttl_disables(self):
+        cache = UserRecordCache(ttl=0, max_size=100)
+        cache.set("user001", self._record("user001"))
+
+        assert cache.get("user001") == (False, None)
+
+    def test_lru_eviction(self):
+        cache = UserRecordCache(ttl=60, max_size=2)
+        cache.set("a", self._record("a"))
+        cache.set("b", self._record("b"))
+        cache.get("a")
+        cache.set("c", self._record("c"))
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a")[0] is True
+        assert cache.get("c")[0] is True
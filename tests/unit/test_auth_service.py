@@ -0,0 +1,375 @@
+"""
+Auth Domain Service 단위 테스트
+
+비밀번호 검증 등 AuthService의 내부 로직을 테스트합니다.
+"""
+
+import asyncio
+import os
+import time
+
+import bcrypt
+import pytest
+from jose import jwt
+
+from server.app.core.config import settings
+from server.app.core.rate_limit import RATE_LIMIT_MESSAGE, TokenBucketRateLimiter
+from server.app.domain.auth.passwords import hash_password
+from server.app.domain.auth.schemas import LoginRequest, UserRecord
+from server.app.domain.auth.service import INVALID_HASH, AuthService
+from server.app.shared.exceptions import TooManyRequestsException
+
+
+@pytest.fixture
+def auth_service() -> AuthService:
+    """
+    DB 연결 없이 사용할 AuthService 인스턴스를 제공합니다.
+    """
+    return AuthService()
+
+
+def _make_hash(password: str, cost: int = 4) -> str:
+    """테스트용 bcrypt 해시 생성 (빠른 테스트를 위해 최소 cost 사용)"""
+    return hash_password(password, cost)
+
+
+def _make_legacy_hash(password: str, prefix: bytes = b"2a") -> str:
+    """레거시 시스템이 원문 비밀번호로 만든 bcrypt 해시"""
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(4, prefix=prefix)
+    ).decode("utf-8")
+
+
+class FakeAuthRepository:
+    """
+    비밀번호 갱신 호출을 기록하는 테스트용 Repository
+    """
+
+    def __init__(self, users: dict[str, UserRecord] | None = None):
+        self.users = users or {}
+        self.updated: dict[str, str] = {}
+
+    async def find_user_by_username(self, db, username: str) -> UserRecord | None:
+        return self.users.get(username)
+
+    async def update_password(self, db, username: str, password_hash: str) -> None:
+        self.updated[username] = password_hash
+
+
+@pytest.mark.unit
+class TestVerifyPassword:
+    """
+    AuthService._verify_password 테스트
+    """
+
+    async def test_bcrypt_hash_match(self, auth_service: AuthService):
+        """bcrypt 해시와 일치하는 비밀번호"""
+        stored = _make_hash("password123")
+
+        assert await auth_service._verify_password("password123", stored) is True
+
+    async def test_bcrypt_hash_mismatch(self, auth_service: AuthService):
+        """bcrypt 해시와 일치하지 않는 비밀번호"""
+        stored = _make_hash("password123")
+
+        assert await auth_service._verify_password("password124", stored) is False
+
+    async def test_long_password_not_truncated(self, auth_service: AuthService):
+        """72바이트를 넘는 비밀번호도 전체가 검증에 사용됨"""
+        base = "a" * 80
+        stored = _make_hash(base + "x")
+
+        assert await auth_service._verify_password(base + "x", stored) is True
+        assert await auth_service._verify_password(base + "y", stored) is False
+
+    async def test_legacy_plaintext(self, auth_service: AuthService):
+        """레거시 평문 비밀번호 호환"""
+        assert await auth_service._verify_password("legacy", "legacy") is True
+        assert await auth_service._verify_password("legacy", "legacy2") is False
+
+    async def test_legacy_bcrypt_hash(self, auth_service: AuthService):
+        """원문 비밀번호로 만든 레거시 bcrypt 해시($2a$ 등) 호환"""
+        stored = _make_legacy_hash("password123")
+
+        assert stored.startswith("$2a$")
+        assert await auth_service._verify_password("password123", stored) is True
+        assert await auth_service._verify_password("password124", stored) is False
+
+    async def test_legacy_bcrypt_long_password(self, auth_service: AuthService):
+        """72바이트를 넘는 레거시 비밀번호는 앞 72바이트로 검증 (레거시 해시 생성 방식)"""
+        password = "a" * 80
+        stored = bcrypt.hashpw(
+            password.encode("utf-8")[:72], bcrypt.gensalt(4, prefix=b"2a")
+        ).decode("utf-8")
+
+        assert await auth_service._verify_password(password, stored) is True
+        assert await auth_service._verify_password("a" * 71, stored) is False
+
+    async def test_malformed_hash(self, auth_service: AuthService):
+        """손상된 bcrypt 해시는 검증 실패"""
+        assert await auth_service._verify_password("password123", "$2b$12$broken") is False
+
+
+@pytest.mark.unit
+class TestCheckNeedsRehash:
+    """
+    AuthService._check_needs_rehash 테스트
+    """
+
+    @pytest.fixture
+    def rehash_service(self) -> AuthService:
+        service = AuthService()
+        service.repository = FakeAuthRepository()
+        service.bcrypt_cost = 5
+        return service
+
+    async def test_same_cost_skipped(self, rehash_service: AuthService):
+        """설정과 같은 cost의 해시는 재해싱하지 않음"""
+        stored = _make_hash("password123", cost=5)
+
+        rehashed = await rehash_service._check_needs_rehash(None, "password123", "user001", stored)
+
+        assert rehashed is False
+        assert rehash_service.repository.updated == {}
+
+    async def test_cost_changed(self, rehash_service: AuthService):
+        """cost가 다르면 현재 설정으로 재해싱"""
+        stored = _make_hash("password123", cost=4)
+
+        rehashed = await rehash_service._check_needs_rehash(None, "password123", "user001", stored)
+
+        assert rehashed is True
+        new_hash = rehash_service.repository.updated["user001"]
+        assert new_hash.startswith("$bcrypt-sha256$$2b$05$")
+        assert await rehash_service._verify_password("password123", new_hash) is True
+
+    async def test_legacy_plaintext_migrated(self, rehash_service: AuthService):
+        """레거시 평문 비밀번호는 bcrypt로 마이그레이션"""
+        assert await rehash_service._check_needs_rehash(None, "legacy", "user001", "legacy") is True
+        assert rehash_service.repository.updated["user001"].startswith("$bcrypt-sha256$$2b$05$")
+
+    async def test_legacy_bcrypt_migrated(self, rehash_service: AuthService):
+        """레거시 bcrypt 해시는 cost와 관계없이 식별자가 붙은 형식으로 재해싱"""
+        stored = _make_legacy_hash("password123", prefix=b"2b")
+
+        rehashed = await rehash_service._check_needs_rehash(None, "password123", "user001", stored)
+
+        assert rehashed is True
+        new_hash = rehash_service.repository.updated["user001"]
+        assert new_hash.startswith("$bcrypt-sha256$$2b$05$")
+        assert await rehash_service._verify_password("password123", new_hash) is True
+
+
+@pytest.mark.unit
+class TestUserEnumeration:
+    """
+    사용자 존재 여부에 따른 응답 차이 방지 테스트
+    """
+
+    async def test_unknown_user_verifies_dummy_hash(self, monkeypatch):
+        """존재하지 않는 사용자도 더미 해시로 비밀번호 검증을 수행"""
+        service = AuthService()
+        service.repository = FakeAuthRepository()
+        verified: list[str] = []
+
+        async def fake_verify(input_password: str, stored_password: str) -> bool:
+            verified.append(stored_password)
+            return False
+
+        monkeypatch.setattr(service, "_verify_password", fake_verify)
+
+        request = LoginRequest(username="nobody", password="password123")
+        result = await service.execute(request, db=None)
+
+        assert result.success is False
+        assert verified == [INVALID_HASH]
+
+    @pytest.fixture
+    def checked_hashes(self, auth_service: AuthService, monkeypatch) -> list[str]:
+        """auth_service._bcrypt_checkpw에 전달된 해시를 기록"""
+        checked: list[str] = []
+        original = auth_service._bcrypt_checkpw
+
+        async def recording_checkpw(password: bytes, bcrypt_hash: str) -> bool:
+            checked.append(bcrypt_hash)
+            return await original(password, bcrypt_hash)
+
+        monkeypatch.setattr(auth_service, "_bcrypt_checkpw", recording_checkpw)
+        return checked
+
+    async def test_plaintext_mismatch_verifies_dummy_hash(
+        self, auth_service: AuthService, checked_hashes: list[str]
+    ):
+        """레거시 평문 불일치도 더미 해시 검증 비용을 지불"""
+        assert await auth_service._verify_password("wrong", "legacy") is False
+        assert checked_hashes == [INVALID_HASH.removeprefix("$bcrypt-sha256$")]
+
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            pytest.param(_make_hash("secret", cost=4), id="current-hash"),
+            pytest.param(_make_hash("secret", cost=5), id="older-cost"),
+            pytest.param(_make_legacy_hash("secret"), id="legacy-bcrypt"),
+        ],
+    )
+    async def test_bcrypt_hash_skips_dummy_hash(
+        self, auth_service: AuthService, checked_hashes: list[str], stored: str
+    ):
+        """bcrypt 해시는 저장된 해시만 한 번 검증 (더미 해시 추가 검증 없음)"""
+        auth_service.bcrypt_cost = 4
+
+        assert await auth_service._verify_password("wrong", stored) is False
+        assert checked_hashes == [stored.removeprefix("$bcrypt-sha256$")]
+
+    async def test_same_error_message(self):
+        """사용자 없음과 비밀번호 불일치의 에러 메시지가 구분되지 않음"""
+        service = AuthService()
+        service.repository = FakeAuthRepository({
+            "user001": UserRecord(user_id="user001", password="secret", user_name="홍길동"),
+        })
+
+        unknown = await service.execute(LoginRequest(username="nobody", password="secret"), db=None)
+        wrong = await service.execute(LoginRequest(username="user001", password="wrong"), db=None)
+
+        assert unknown.error == wrong.error
+
+
+@pytest.mark.unit
+class TestUsernameRateLimit:
+    """
+    사용자 ID별 로그인 시도 제한 테스트
+    """
+
+    async def test_rejected_before_lookup(self):
+        """한도를 넘으면 사용자 조회 없이 거부"""
+        service = AuthService()
+        service.repository = FakeAuthRepository()
+        service.username_rate_limiter = TokenBucketRateLimiter(capacity=1, period=60)
+        lookups: list[str] = []
+
+        async def fake_find(db, username: str):
+            lookups.append(username)
+            return None
+
+        service.repository.find_user_by_username = fake_find
+
+        await service.execute(LoginRequest(username="user001", password="wrong"), db=None)
+        result = await service.execute(LoginRequest(username="user001", password="wrong"), db=None)
+
+        assert result.success is False
+        assert result.error == RATE_LIMIT_MESSAGE
+        assert result.error_type is TooManyRequestsException
+        assert result.metadata["retry_after"] > 0
+        assert lookups == ["user001"]
+
+
+@pytest.mark.unit
+class TestExecute:
+    """
+    AuthService.execute 성공 흐름 테스트
+    """
+
+    @pytest.fixture
+    def login_service(self) -> AuthService:
+        service = AuthService()
+        service.repository = FakeAuthRepository({
+            "user001": UserRecord(
+                user_id="user001", password=_make_hash("secret"), user_name="홍길동"
+            ),
+        })
+        service.username_rate_limiter = TokenBucketRateLimiter(capacity=10, period=60)
+        return service
+
+    async def test_token_subject(self, login_service: AuthService):
+        request = LoginRequest(username="user001", password="secret")
+        result = await login_service.execute(request, db=None)
+
+        claims = jwt.decode(result.data.token, settings.SECRET_KEY, algorithms=["HS256"])
+        assert claims["sub"] == "user001"
+
+    async def test_lookup_cancelled_on_early_exit(self, login_service: AuthService, monkeypatch):
+        """토큰 생성이 실패하면 진행 중인 사용자 조회를 취소"""
+        lookup_state: list[str] = []
+
+        async def pending_find(db, username: str):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                lookup_state.append("cancelled")
+                raise
+
+        def failing_token(user_id: str) -> str:
+            raise RuntimeError("signing failed")
+
+        monkeypatch.setattr(login_service.repository, "find_user_by_username", pending_find)
+        monkeypatch.setattr(login_service, "_generate_access_token", failing_token)
+
+        request = LoginRequest(username="user001", password="secret")
+        result = await login_service.execute(request, db=None)
+
+        assert result.success is False
+        assert lookup_state == ["cancelled"]
+
+    async def test_after_execute_does_not_block(self, login_service: AuthService, monkeypatch):
+        """실행 후 훅이 끝나기 전에 결과를 반환"""
+        released = asyncio.Event()
+        finished: list[bool] = []
+
+        async def slow_after_execute(request, result) -> None:
+            await released.wait()
+            finished.append(result.success)
+
+        monkeypatch.setattr(login_service, "after_execute", slow_after_execute)
+
+        request = LoginRequest(username="user001", password="secret")
+        result = await login_service.execute(request, db=None)
+
+        assert result.success is True
+        assert finished == []
+
+        released.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert finished == [True]
+
+
+@pytest.mark.unit
+class TestAccessToken:
+    """
+    AuthService._generate_access_token 테스트
+    """
+
+    def test_claims(self, auth_service: AuthService):
+        token = auth_service._generate_access_token("user001")
+
+        claims = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+        assert claims["sub"] == "user001"
+        assert claims["exp"] - claims["iat"] == settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    os.environ.get("BCRYPT_BENCHMARK") != "1",
+    reason="하드웨어 의존 벤치마크 (BCRYPT_BENCHMARK=1 설정 시 실행)",
+)
+class TestBcryptCost:
+    """
+    운영 서버에서 BCRYPT_COST 설정이 목표 지연 시간(약 250ms)에 맞는지 확인합니다.
+
+    하드웨어에 따라 결과가 달라지므로 일반 테스트 실행에서는 건너뜁니다.
+    배포 대상 서버에서 직접 실행하세요.
+    (BCRYPT_BENCHMARK=1 pytest -m slow)
+    """
+
+    def test_hash_duration_within_target(self):
+        salt = bcrypt.gensalt(settings.BCRYPT_COST)
+
+        start = time.perf_counter()
+        bcrypt.hashpw(b"x", salt)
+        elapsed = time.perf_counter() - start
+
+        assert 0.2 <= elapsed <= 0.35, (
+            f"bcrypt cost {settings.BCRYPT_COST}: {elapsed * 1000:.0f}ms "
+            f"(목표 200~350ms, BCRYPT_COST를 조정하세요)"
+        )
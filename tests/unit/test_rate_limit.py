@@ -0,0 +1,67 @@
+"""
+Core Rate Limit 단위 테스트
+
+Token Bucket 요청 제한기의 소비/충전 동작을 테스트합니다.
+"""
+
+import pytest
+
+from server.app.core.rate_limit import TokenBucketRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    """time.monotonic을 고정된 값으로 대체합니다."""
+    now = [1000.0]
+    monkeypatch.setattr("server.app.core.rate_limit.time.monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestTokenBucketRateLimiter:
+    """
+    TokenBucketRateLimiter 테스트
+    """
+
+    def test_allows_up_to_capacity(self, clock: list[float]):
+        limiter = TokenBucketRateLimiter(capacity=3, period=60)
+
+        assert [limiter.acquire("1.2.3.4") for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire("1.2.3.4") == pytest.approx(20)
+
+    def test_keys_are_independent(self, clock: list[float]):
+        limiter = TokenBucketRateLimiter(capacity=1, period=60)
+
+        assert limiter.acquire("a") == 0
+        assert limiter.acquire("b") == 0
+        assert limiter.acquire("a") > 0
+
+    def test_refill(self, clock: list[float]):
+        """period / capacity 초마다 토큰 1개 충전"""
+        limiter = TokenBucketRateLimiter(capacity=2, period=60)
+        limiter.acquire("a")
+        limiter.acquire("a")
+
+        clock[0] += 29
+        assert limiter.acquire("a") > 0
+
+        clock[0] += 1
+        assert limiter.acquire("a") == 0
+
+    def test_max_keys(self, clock: list[float]):
+        """추적 키 수를 넘으면 가장 오래된 키의 상태를 제거"""
+        limiter = TokenBucketRateLimiter(capacity=1, period=60, max_keys=2)
+        limiter.acquire("a")
+        limiter.acquire("b")
+        limiter.acquire("c")
+
+        assert limiter.acquire("a") == 0
+        assert limiter.acquire("c") > 0
+
+    def test_clear(self, clock: list[float]):
+        limiter = TokenBucketRateLimiter(capacity=1, period=60)
+        limiter.acquire("a")
+
+        limiter.clear()
+
+        assert limiter.acquire("a") == 0